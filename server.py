@@ -1,75 +1,222 @@
+import heapq
+import itertools
+import multiprocessing
+from collections import deque
+
 from mesa import Agent, Model
-from mesa.time import RandomActivation
-from mesa.datacollection import DataCollector
-import random
+from mesa.time import BaseScheduler
+import numpy as np
+
+# Trazas de inicio/fin de servicio: imprimir en cada evento es órdenes de
+# magnitud más caro que la aritmética del paso, así que queda desactivado.
+DEBUG = False
+
+# Estado de un servidor empaquetado en un solo registro con tipos estrechos
+# (19 B por servidor en vez de un arreglo suelto por campo): el conjunto de
+# trabajo de miles de servidores cabe en la caché de primer nivel.
+SERVER_DTYPE = np.dtype([
+    ("busy", "i1"),
+    ("remaining", "i2"),
+    ("task_id", "i4"),
+    ("in_svc", "i2"),          # Tiempo de servicio inicial de la tarea en curso
+    ("total_svc", "i4"),       # Tiempo total servido
+    ("tasks_served", "i4"),    # Tareas completadas
+    ("qlen", "i2"),            # Longitud de la cola de espera
+])
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba es opcional: sin él, el kernel corre igual como Python puro.
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, boundscheck=False)
+def _advance(busy, remaining, in_service_time, service_time_per_server, total_tasks_served):
+    """Avanza un tick todos los servidores (kernel compilado con Numba).
+
+    Decrementa el tiempo restante de los ocupados, marca como libres los que
+    terminaron y acumula sus estadísticas. Devuelve los índices de los
+    servidores que completaron y el tiempo de servicio total completado.
+    """
+    finished = np.empty(busy.shape[0], dtype=np.int64)
+    n_finished = 0
+    completed_time = 0
+    for i in range(busy.shape[0]):
+        if busy[i]:
+            remaining[i] -= 1
+            if remaining[i] <= 0:
+                busy[i] = 0
+                # El int() evita que, sin Numba, la suma herede el dtype
+                # estrecho (i2) del elemento y se desborde en un mismo tick.
+                completed_time += int(in_service_time[i])
+                service_time_per_server[i] += in_service_time[i]
+                total_tasks_served[i] += 1
+                finished[n_finished] = i
+                n_finished += 1
+    return finished[:n_finished], completed_time
+
+
+@njit(cache=True, boundscheck=False)
+def _stats(busy, qlen):
+    """Cuenta servidores ocupados y suma las colas en una sola pasada.
+
+    Fusiona lo que serían dos reducciones independientes (busy.sum() y
+    qlen.sum()) en un solo barrido de los campos del recarray.
+    """
+    busy_count = 0
+    qlen_total = 0
+    for i in range(busy.shape[0]):
+        # El int() evita que, sin Numba, la suma herede el dtype estrecho
+        # del elemento (i1/i2) y se desborde con muchos servidores.
+        busy_count += int(busy[i])
+        qlen_total += int(qlen[i])
+    return busy_count, qlen_total
+
+
+# Kernels especializados ya generados, por número de servidores
+_ADVANCE_CACHE = {}
+_UNROLL_LIMIT = 8
+
+
+def _specialized_advance(num_servers):
+    """Genera (y cachea) una variante de `_advance` con `num_servers` fijo.
+
+    Con el número de servidores como literal, el bucle se emite totalmente
+    desenrollado: sin contador, sin comprobación de límites y con cada
+    índice como constante. Se usa en lugar del kernel genérico cuando Numba
+    no está disponible y el conteo es pequeño; con Numba, @njit ya
+    especializa por firma de tipos.
+    """
+    fn = _ADVANCE_CACHE.get(num_servers)
+    if fn is None:
+        lines = [
+            "def _advance_fixed(busy, remaining, in_service_time,"
+            " service_time_per_server, total_tasks_served):",
+            "    finished = []",
+            "    completed_time = 0",
+        ]
+        for i in range(num_servers):
+            lines += [
+                f"    if busy[{i}]:",
+                f"        remaining[{i}] -= 1",
+                f"        if remaining[{i}] <= 0:",
+                f"            busy[{i}] = 0",
+                f"            completed_time += int(in_service_time[{i}])",
+                f"            service_time_per_server[{i}] += in_service_time[{i}]",
+                f"            total_tasks_served[{i}] += 1",
+                f"            finished.append({i})",
+            ]
+        lines.append("    return finished, completed_time")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        fn = _ADVANCE_CACHE[num_servers] = namespace["_advance_fixed"]
+    return fn
 
 
 # Definición del agente Servidor
+# Ahora es un proxy ligero: el estado real vive en los arreglos NumPy del
+# modelo (estructura de arreglos) y aquí solo se exponen vistas de lectura
+# para el DataCollector.
 class ServerAgent(Agent):
     def __init__(self, unique_id, model):
         super().__init__(unique_id, model)
-        self.busy = False  # Estado inicial del servidor
-        self.current_task = None  # Tarea que está sirviendo
-        self.total_service_time = 0  # Tiempo total que ha servido
-        self.queue = []  # Cola de tareas en espera
-        self.total_tasks_served = 0  # Contador de tareas completadas
 
-    def step(self):
-        if self.busy and self.current_task:  # Si está ocupado, sigue sirviendo la tarea
-            self.current_task.remaining_service_time -= 1
-            if self.current_task.remaining_service_time <= 0:
-                self.complete_service()  # Completa el servicio si el tiempo ha llegado a 0
-
-        if not self.busy and len(self.queue) > 0:  # Si no está ocupado, comienza una nueva tarea de la cola
-            self.begin_service(self.queue.pop(0))
-
-    def begin_service(self, task):
-        """Comenzar el servicio de una nueva tarea."""
-        self.busy = True
-        self.current_task = task
-        task.assigned_server = self
-        task.queue_wait_time = self.model.current_step - task.arrival_time  # Tiempo que esperó en la cola
-        print(f"Servidor {self.unique_id} comenzando servicio a tarea {task.unique_id}")
-
-    def complete_service(self):
-        """Finalizar el servicio de la tarea actual."""
-        print(f"Servidor {self.unique_id} completó el servicio de tarea {self.current_task.unique_id}")
-        self.busy = False
-        self.total_service_time += self.current_task.initial_service_time
-        self.total_tasks_served += 1
-        self.current_task = None
-
-
-# Definición del agente Tarea
-class TaskAgent(Agent):
-    def __init__(self, unique_id, model, service_time):
-        super().__init__(unique_id, model)
-        self.initial_service_time = service_time
-        self.remaining_service_time = service_time  # Tiempo de servicio que aún queda
-        self.assigned_server = None  # Servidor asignado (al que está esperando)
-        self.arrival_time = model.current_step  # Tiempo en el que la tarea llegó al sistema
-        self.queue_wait_time = 0  # Tiempo que la tarea pasó en cola
+    @property
+    def busy(self):
+        return bool(self.model.srv.busy[self.unique_id])
 
-    def step(self):
-        """Tareas no hacen nada activamente, esperan ser atendidas por un servidor."""
-        pass
+    @property
+    def queue(self):
+        return self.model.queues[self.unique_id]
+
+    @property
+    def queue_len(self):
+        return int(self.model.srv.qlen[self.unique_id])
+
+    @property
+    def current_task(self):
+        return int(self.model.srv.task_id[self.unique_id])
+
+    @property
+    def total_service_time(self):
+        return int(self.model.srv.total_svc[self.unique_id])
+
+    @property
+    def total_tasks_served(self):
+        return int(self.model.srv.tasks_served[self.unique_id])
 
 
 # Modelo del sistema de colas
 class QueueServerModel(Model):
-    def __init__(self, num_servers, task_arrival_rate, task_service_rate, max_steps):
+    def __init__(self, num_servers, task_arrival_rate, task_service_rate, max_steps, mode="ticks", seed=None):
         self.num_servers = num_servers
         self.task_arrival_rate = task_arrival_rate  # Tasa de llegada de tareas
         self.task_service_rate = task_service_rate  # Tasa de servicio de las tareas
         self.max_steps = max_steps
-        self.schedule = RandomActivation(self)
+        # Los servidores no interactúan entre sí, así que el barajado de
+        # RandomActivation no cambia nada observable; basta el orden fijo.
+        self.schedule = BaseScheduler(self)
         self.running = True
         self.current_step = 0
 
+        # "ticks" avanza paso a paso con step(); "events" salta de evento en
+        # evento con run_events() usando un min-heap de (tiempo, servidor).
+        self.mode = mode
+        self.events = []
+        self._last_logged = 0  # Hasta dónde están escritas las series en modo eventos
+        # (servidores ocupados, suma de colas) al último corte registrado;
+        # los getters agregados leen de aquí en O(1).
+        self._last_stats = (0, 0)
+
         # Variables para estadísticas
         self.total_queue_wait_time = 0
         self.total_time_in_system = 0
         self.total_tasks = 0
+        self.total_completed = 0
+        self.total_service_time = 0
+
+        # Estado de los servidores empaquetado en un recarray compacto: un
+        # paso del modelo opera sobre los campos (vistas NumPy) con unas
+        # pocas operaciones en lugar de un bucle por agente.
+        self.srv = np.zeros(num_servers, dtype=SERVER_DTYPE).view(np.recarray)
+        self.srv.task_id[:] = -1
+        # Máscara de bits con los servidores ocupados: permite encontrar el
+        # servidor libre más bajo en O(1) con aritmética de bits.
+        self.busy_mask = 0
+        # Cola de tareas en espera (ids) por servidor. La cola más corta se
+        # elige con un min-heap de (longitud, servidor) con borrado perezoso:
+        # cada cambio de longitud empuja una entrada nueva y las obsoletas se
+        # descartan al toparlas, usando el campo qlen del recarray como
+        # verdad. Así la búsqueda no recorre todos los servidores.
+        self.queues = [deque() for _ in range(num_servers)]
+        self._qheap = [(0, i) for i in range(num_servers)]
+        # Las tareas no son agentes: cada una es una fila en esta tabla de
+        # arreglos paralelos, identificada por su índice. Se preasigna según
+        # la tasa de llegada esperada y se duplica la capacidad si se llena.
+        self._task_capacity = max(int(max_steps * task_arrival_rate * 1.5), 16)
+        self.task_arrival_time = np.zeros(self._task_capacity, dtype=np.int32)
+        self.task_service_time = np.zeros(self._task_capacity, dtype=np.int32)
+        self.task_server = np.full(self._task_capacity, -1, dtype=np.int32)
+        self.task_queue_wait = np.zeros(self._task_capacity, dtype=np.int32)
+        self.n_tasks = 0
+
+        # Muestrear de antemano todas las llegadas y tiempos de servicio con
+        # una sola llamada al generador, en lugar de un random.random() y un
+        # random.expovariate() por tick.
+        self._rng = np.random.default_rng(seed)
+        self._arrival_mask = self._rng.random(max_steps) < task_arrival_rate
+        self._arrival_times = np.flatnonzero(self._arrival_mask)
+        n_arrivals = int(self._arrival_mask.sum())
+        self._service_times = self._rng.exponential(1.0 / task_service_rate, n_arrivals).astype(np.int32)
+        np.maximum(self._service_times, 1, out=self._service_times)
+        self._next_arrival = 0  # Índice de la próxima llegada en _service_times
 
         # Crear servidores (agents)
         self.servers = []
@@ -78,62 +225,248 @@ class QueueServerModel(Model):
             self.schedule.add(server)
             self.servers.append(server)
 
-        # Colector de datos para estadísticas
-        self.datacollector = DataCollector(
-            agent_reporters={"Busy": "busy", "Queue Size": lambda a: len(a.queue) if isinstance(a, ServerAgent) else 0}
-        )
+        # Kernel de paso: el compilado con Numba, o uno generado con el
+        # número de servidores desenrollado como literal cuando Numba no
+        # está disponible y el conteo es pequeño.
+        if NUMBA_AVAILABLE or num_servers > _UNROLL_LIMIT:
+            self._advance = _advance
+        else:
+            self._advance = _specialized_advance(num_servers)
+
+        # Series de tiempo preasignadas en lugar del DataCollector de Mesa:
+        # se registran dos enteros por tick en vez de una fila por agente.
+        self.busy_log = np.zeros(max_steps, dtype=np.int16)
+        self.qlen_log = np.zeros(max_steps, dtype=np.int32)
 
     def step(self):
-        """Avanza el modelo un paso."""
-        # Crear nuevas tareas de acuerdo con la tasa de llegada
-        if random.random() < self.task_arrival_rate:
-            service_time = int(random.expovariate(self.task_service_rate))  # Tiempo de servicio basado en la tasa
-            new_task = TaskAgent(self.current_step, self, service_time)
-            self.schedule.add(new_task)
+        """Avanza el modelo hasta el próximo tick con eventos.
+
+        Los ticks intermedios en los que no llega ninguna tarea ni termina
+        ningún servicio solo restarían 1 a `remaining`; se saltan en bloque
+        decrementando por el salto completo en una sola operación.
+        """
+        if self._next_arrival < self._arrival_times.shape[0]:
+            next_arrival = int(self._arrival_times[self._next_arrival])
+        else:
+            next_arrival = self.max_steps
+        if self.busy_mask:
+            until_event = min(next_arrival - self.current_step,
+                              int(self.srv.remaining[self.srv.busy == 1].min()))
+        else:
+            until_event = next_arrival - self.current_step
+        skip = min(until_event - 1, self.max_steps - self.current_step - 1)
+        if skip > 0:
+            self.srv.remaining[self.srv.busy == 1] -= skip
+            # Nada cambió desde el último corte: valen las estadísticas cacheadas
+            busy_count, qlen_total = self._last_stats
+            self.busy_log[self.current_step:self.current_step + skip] = busy_count
+            self.qlen_log[self.current_step:self.current_step + skip] = qlen_total
+            self.current_step += skip
+
+        # Crear nuevas tareas de acuerdo con la máscara de llegadas premuestreada
+        if self._arrival_mask[self.current_step]:
+            service_time = int(self._service_times[self._next_arrival])  # Tiempo de servicio premuestreado
+            self._next_arrival += 1
+            task_id = self._new_task(service_time)
             self.total_tasks += 1  # Incrementar el total de tareas
 
             # Asignar tarea a un servidor disponible
             available_server = self.find_available_server()
-            if available_server:
-                available_server.begin_service(new_task)
+            if available_server >= 0:
+                self.begin_service(available_server, task_id)
             else:
                 # Si no hay servidor disponible, agregar la tarea a la cola del servidor con la cola más corta
-                server_with_shortest_queue = min(self.servers, key=lambda s: len(s.queue))
-                server_with_shortest_queue.queue.append(new_task)
+                self._enqueue_shortest(task_id)
 
-        # Ejecutar un paso de todos los agentes
-        self.schedule.step()
-        self.datacollector.collect(self)
+        # Avanzar todos los servidores de una vez con el kernel compilado;
+        # los prints y el manejo de tareas (objetos Python) quedan fuera.
+        finished, completed_time = self._advance(
+            self.srv.busy, self.srv.remaining, self.srv.in_svc,
+            self.srv.total_svc, self.srv.tasks_served,
+        )
+        self.total_service_time += int(completed_time)
+        for i in finished:
+            self.complete_service(int(i))
+
+        # Servidores libres toman la siguiente tarea de su cola
+        for i in np.flatnonzero(self.srv.busy == 0):
+            if self.queues[i]:
+                self.begin_service(int(i), self._dequeue(int(i)))
+
+        self._last_stats = _stats(self.srv.busy, self.srv.qlen)
+        self.busy_log[self.current_step], self.qlen_log[self.current_step] = self._last_stats
 
-        # Actualizar el tiempo en el sistema y el tiempo en cola para las tareas completadas
-        for agent in self.schedule.agents:
-            if isinstance(agent, TaskAgent) and agent.assigned_server is not None:
-                self.total_queue_wait_time += agent.queue_wait_time
-                self.total_time_in_system += (self.current_step - agent.arrival_time)
 
         self.current_step += 1
         if self.current_step >= self.max_steps:
             self.running = False  # Terminar simulación
 
+    def run_events(self):
+        """Ejecuta la simulación completa saltando de evento en evento.
+
+        En lugar de avanzar tick a tick y decrementar `remaining`, mantiene
+        un min-heap con la próxima completación de cada servidor y todas las
+        llegadas premuestreadas, y salta `current_step` directamente al
+        siguiente evento. Los ticks sin eventos no cuestan nada.
+        """
+        for arrival_idx, t in enumerate(np.flatnonzero(self._arrival_mask)):
+            heapq.heappush(self.events, (int(t), -1, arrival_idx))
+
+        while self.events:
+            t, server_id, payload = heapq.heappop(self.events)
+            if t >= self.max_steps:
+                break
+            self._fill_logs(t)
+            self.current_step = t
+            if server_id < 0:
+                # Llegada: payload es el índice en _service_times
+                task_id = self._new_task(int(self._service_times[payload]))
+                self.total_tasks += 1
+                available_server = self.find_available_server()
+                if available_server >= 0:
+                    self._begin_service_event(available_server, task_id, on_arrival_tick=True)
+                else:
+                    self._enqueue_shortest(task_id)
+            else:
+                # Completación: liberar el servidor y tomar la siguiente tarea
+                self._finish_server(server_id)
+                if self.queues[server_id]:
+                    self._begin_service_event(server_id, self._dequeue(server_id))
+
+        self._fill_logs(self.max_steps)
+        self._last_stats = _stats(self.srv.busy, self.srv.qlen)
+        self.current_step = self.max_steps
+        self.running = False
+
+    def _begin_service_event(self, server_id, task_id, on_arrival_tick=False):
+        """begin_service más el evento de completación futura en el heap.
+
+        En modo ticks el kernel corre después de asignar la llegada, así que
+        una tarea que empieza en su tick de llegada recibe su primer
+        decremento ese mismo tick y completa en t + S - 1; una tarea tomada
+        de la cola empieza después del kernel y completa en t + S. El heap
+        reproduce ambos casos para que los dos modos coincidan tick a tick.
+        """
+        self.begin_service(server_id, task_id)
+        done_at = self.current_step + int(self.task_service_time[task_id])
+        if on_arrival_tick:
+            done_at -= 1
+        heapq.heappush(self.events, (done_at, server_id, task_id))
+
+    def _finish_server(self, server_id):
+        """Contabiliza una completación (lo que hace el kernel en modo ticks)."""
+        self.srv.busy[server_id] = 0
+        self.srv.remaining[server_id] = 0
+        served = int(self.srv.in_svc[server_id])
+        self.total_service_time += served
+        self.srv.total_svc[server_id] += served
+        self.srv.tasks_served[server_id] += 1
+        self.complete_service(server_id)
+
+    def _fill_logs(self, upto):
+        """Rellena las series de tiempo entre el último evento y `upto`."""
+        upto = min(upto, self.max_steps)
+        if upto > self._last_logged:
+            self._last_stats = _stats(self.srv.busy, self.srv.qlen)
+            busy_count, qlen_total = self._last_stats
+            self.busy_log[self._last_logged:upto] = busy_count
+            self.qlen_log[self._last_logged:upto] = qlen_total
+            self._last_logged = upto
+
+    def _shortest_queue(self):
+        """Índice del servidor con la cola más corta, vía el min-heap.
+
+        Descarta las entradas cuya longitud ya no coincide con `qlen`
+        (borrado perezoso); siempre hay una entrada vigente por servidor.
+        """
+        while True:
+            qlen, i = self._qheap[0]
+            if qlen == self.srv.qlen[i]:
+                return i
+            heapq.heappop(self._qheap)
+
+    def _enqueue_shortest(self, task_id):
+        """Encola la tarea en el servidor con la cola más corta."""
+        shortest = self._shortest_queue()
+        self.queues[shortest].append(task_id)
+        self.srv.qlen[shortest] += 1
+        heapq.heappush(self._qheap, (int(self.srv.qlen[shortest]), shortest))
+
+    def _dequeue(self, server_id):
+        """Saca la siguiente tarea de la cola del servidor y devuelve su id."""
+        self.srv.qlen[server_id] -= 1
+        heapq.heappush(self._qheap, (int(self.srv.qlen[server_id]), server_id))
+        return self.queues[server_id].popleft()
+
+    def _new_task(self, service_time):
+        """Registra una tarea nueva como fila de la tabla y devuelve su id."""
+        if self.n_tasks == self._task_capacity:
+            self._task_capacity *= 2
+            self.task_arrival_time = np.resize(self.task_arrival_time, self._task_capacity)
+            self.task_service_time = np.resize(self.task_service_time, self._task_capacity)
+            self.task_server = np.resize(self.task_server, self._task_capacity)
+            self.task_server[self.n_tasks:] = -1
+            self.task_queue_wait = np.resize(self.task_queue_wait, self._task_capacity)
+        task_id = self.n_tasks
+        self.task_arrival_time[task_id] = self.current_step
+        self.task_service_time[task_id] = service_time
+        self.n_tasks += 1
+        return task_id
+
+    def begin_service(self, server_id, task_id):
+        """Comenzar el servicio de una nueva tarea en el servidor indicado."""
+        self.srv.busy[server_id] = 1
+        self.busy_mask |= 1 << server_id
+        self.srv.remaining[server_id] = self.task_service_time[task_id]
+        self.srv.in_svc[server_id] = self.task_service_time[task_id]
+        self.srv.task_id[server_id] = task_id
+        self.task_server[task_id] = server_id
+        self.task_queue_wait[task_id] = self.current_step - self.task_arrival_time[task_id]  # Tiempo que esperó en la cola
+        if DEBUG:
+            print(f"Servidor {server_id} comenzando servicio a tarea {task_id}")
+
+    def complete_service(self, server_id):
+        """Finalizar el servicio de la tarea actual del servidor indicado.
+
+        El kernel ya liberó el servidor en el arreglo `busy`; aquí solo se
+        actualiza la máscara de bits y el estado de la tarea.
+        """
+        task_id = int(self.srv.task_id[server_id])
+        if DEBUG:
+            print(f"Servidor {server_id} completó el servicio de tarea {task_id}")
+        # Acumular las estadísticas de la tarea una sola vez, al completarse
+        self.total_queue_wait_time += int(self.task_queue_wait[task_id])
+        self.total_time_in_system += self.current_step - int(self.task_arrival_time[task_id])
+        self.total_completed += 1
+        self.busy_mask &= ~(1 << server_id)
+        self.srv.task_id[server_id] = -1
+
     def find_available_server(self):
-        """Encuentra un servidor que no esté ocupado."""
-        for server in self.servers:
-            if not server.busy:
-                return server
-        return None
+        """Encuentra el índice del servidor libre más bajo en O(1), o -1."""
+        free = ~self.busy_mask & ((1 << self.num_servers) - 1)
+        return (free & -free).bit_length() - 1 if free else -1
+
+    def get_dataframe(self):
+        """Construye (bajo demanda) un DataFrame con las series registradas."""
+        import pandas as pd
+
+        steps = self.current_step
+        return pd.DataFrame({
+            "Busy Servers": self.busy_log[:steps],
+            "Queue Size": self.qlen_log[:steps],
+        })
 
     def get_queue_lengths(self):
         """Devuelve las longitudes de las colas de los servidores."""
-        return [len(server.queue) for server in self.servers]
+        return [int(n) for n in self.srv.qlen]
 
     def get_busy_servers(self):
-        """Devuelve el número de servidores ocupados."""
-        return sum(1 for server in self.servers if server.busy)
+        """Devuelve el número de servidores ocupados (del último corte)."""
+        return int(self._last_stats[0])
 
     def get_avg_queue_length(self):
-        """Calcula el largo promedio de las colas."""
-        total_queue_length = sum(len(server.queue) for server in self.servers)
-        return total_queue_length / self.num_servers
+        """Calcula el largo promedio de las colas (del último corte)."""
+        return int(self._last_stats[1]) / self.num_servers
 
     def get_avg_servers_busy(self):
         """Calcula el promedio de servidores ocupados."""
@@ -141,29 +474,76 @@ class QueueServerModel(Model):
         return busy_servers / self.num_servers
 
     def get_avg_time_in_queue(self):
-        """Calcula el tiempo promedio en la cola."""
-        if self.total_tasks > 0:
-            return self.total_queue_wait_time / self.total_tasks
+        """Calcula el tiempo promedio en la cola (sobre tareas completadas)."""
+        if self.total_completed > 0:
+            return self.total_queue_wait_time / self.total_completed
         return 0
 
     def get_avg_time_in_system(self):
-        """Calcula el tiempo promedio en el sistema."""
-        if self.total_tasks > 0:
-            return self.total_time_in_system / self.total_tasks
+        """Calcula el tiempo promedio en el sistema (sobre tareas completadas)."""
+        if self.total_completed > 0:
+            return self.total_time_in_system / self.total_completed
         return 0
 
 
+def run_once(params):
+    """Corre una réplica con los parámetros dados y devuelve sus estadísticas.
+
+    `params` debe traer num_servers, task_arrival_rate, task_service_rate y
+    max_steps; opcionalmente mode y seed.
+    """
+    model = QueueServerModel(
+        params["num_servers"], params["task_arrival_rate"],
+        params["task_service_rate"], params["max_steps"],
+        mode=params.get("mode", "ticks"), seed=params.get("seed"),
+    )
+    if model.mode == "events":
+        model.run_events()
+    else:
+        while model.running:
+            model.step()
+    return {
+        **params,
+        "total_tasks": model.total_tasks,
+        "total_completed": model.total_completed,
+        "avg_time_in_queue": model.get_avg_time_in_queue(),
+        "avg_time_in_system": model.get_avg_time_in_system(),
+        "avg_queue_length": model.get_avg_queue_length(),
+        "avg_servers_busy": model.get_avg_servers_busy(),
+    }
+
+
+def sweep(num_servers_values, arrival_rate_values, service_rate_values,
+          max_steps=1000, mode="ticks", processes=None):
+    """Barrido de parámetros en paralelo: una réplica por combinación.
+
+    Cada réplica es independiente (sin estado compartido), así que se
+    reparten entre procesos con Pool.map; cada una recibe una semilla
+    distinta para ser reproducible.
+    """
+    param_grid = [
+        {"num_servers": n, "task_arrival_rate": a, "task_service_rate": s,
+         "max_steps": max_steps, "mode": mode, "seed": seed}
+        for seed, (n, a, s) in enumerate(
+            itertools.product(num_servers_values, arrival_rate_values, service_rate_values))
+    ]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(run_once, param_grid)
+
+
 # Ejemplo de uso
 if __name__ == "__main__":
     num_servers = 1  # Número de servidores
     task_arrival_rate = 0.9  # Tasa de llegada de tareas
     task_service_rate = 0.4  # Tasa de servicio de tareas (inverso del tiempo promedio)
     max_steps = 100  # Número máximo de pasos
-
     model = QueueServerModel(num_servers, task_arrival_rate, task_service_rate, max_steps)
 
-    while model.running:
-        model.step()
+    if model.mode == "events":
+        model.run_events()
+    else:
+        while model.running:
+            model.step()
 
     # Mostrar algunas estadísticas al final
     print("Longitudes finales de las colas por servidor:", model.get_queue_lengths())